@@ -21,7 +21,7 @@ import enum
 import functools
 import numbers
 import types
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 
 import numpy as np
 import numpy.typing as npt
@@ -143,7 +143,9 @@ class UnitRange(Sequence[int], Generic[_Left, _Right]):
             object.__setattr__(self, "stop", 0)
 
     @classmethod
+    @functools.cache
     def infinite(cls) -> UnitRange:
+        # ranges are immutable, therefore a single instance is shared
         return cls(Infinity.NEGATIVE, Infinity.POSITIVE)
 
     def __len__(self) -> int:
@@ -412,6 +414,13 @@ class Domain(Sequence[NamedRange[_Rng]], Generic[_Rng]):
     def __len__(self) -> int:
         return len(self.ranges)
 
+    def __iter__(self) -> Iterator[NamedRange[_Rng]]:
+        return map(NamedRange, self.dims, self.ranges)
+
+    @functools.cached_property
+    def _dim_index(self) -> dict[Dimension, int]:
+        return {dim: i for i, dim in enumerate(self.dims)}
+
     @property
     def ndim(self) -> int:
         return len(self.dims)
@@ -445,11 +454,9 @@ class Domain(Sequence[NamedRange[_Rng]], Generic[_Rng]):
             ranges_slice = self.ranges[index]
             return Domain(dims=dims_slice, ranges=ranges_slice)
         elif isinstance(index, Dimension):
-            try:
-                index_pos = self.dims.index(index)
-                return NamedRange(dim=self.dims[index_pos], unit_range=self.ranges[index_pos])
-            except ValueError as ex:
-                raise KeyError(f"No Dimension of type '{index}' is present in the Domain.") from ex
+            if (index_pos := self._dim_index.get(index, None)) is None:
+                raise KeyError(f"No Dimension of type '{index}' is present in the Domain.")
+            return NamedRange(dim=self.dims[index_pos], unit_range=self.ranges[index_pos])
         else:
             raise KeyError("Invalid index type, must be either int, slice, or Dimension.")
 
@@ -484,7 +491,7 @@ class Domain(Sequence[NamedRange[_Rng]], Generic[_Rng]):
         return f"Domain({', '.join(f'{e}' for e in self)})"
 
     def dim_index(self, dim: Dimension) -> Optional[int]:
-        return self.dims.index(dim) if dim in self.dims else None
+        return self._dim_index.get(dim, None)
 
     def pop(self, index: int | Dimension = -1) -> Domain:
         return self.replace(index)
@@ -98,10 +98,14 @@ def _absolute_sub_domain(
     return common.Domain(*named_ranges)
 
 
+@functools.lru_cache(maxsize=1024)
 def domain_intersection(*domains: common.Domain) -> common.Domain:
     """
     Return the intersection of the given domains.
 
+    The result is cached, as the same combinations of domains are intersected over and over
+    in field arithmetic.
+
     Example:
         >>> I = common.Dimension("I")
         >>> domain_intersection(
@@ -136,12 +140,16 @@ def restrict_to_intersection(
             for domain in domains
         ]
     )
+    # the ignored dimensions are not part of the intersection, they keep their original range
+    intersected_ranges = dict(
+        zip(intersection_without_ignore_dims.dims, intersection_without_ignore_dims.ranges)
+    )
     return tuple(
         common.Domain(
-            *[
-                (nr if nr.dim in ignore_dims_tuple else intersection_without_ignore_dims[nr.dim])
-                for nr in domain
-            ]
+            dims=domain.dims,
+            ranges=tuple(
+                intersected_ranges.get(dim, rng) for dim, rng in zip(domain.dims, domain.ranges)
+            ),
         )
         for domain in domains
     )
@@ -184,6 +192,8 @@ def _find_index_of_dim(
     dim: common.Dimension,
     domain_slice: common.Domain | Sequence[common.NamedRange | common.NamedIndex | Any],
 ) -> Optional[int]:
+    if isinstance(domain_slice, common.Domain):
+        return domain_slice.dim_index(dim)
     for i, (d, _) in enumerate(domain_slice):
         if dim == d:
             return i
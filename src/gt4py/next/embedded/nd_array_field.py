@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import dataclasses
 import functools
+import itertools
 from collections.abc import Callable, Sequence
 from types import ModuleType
 from typing import ClassVar, Iterable
@@ -24,7 +25,7 @@ import numpy as np
 from numpy import typing as npt
 
 from gt4py._core import definitions as core_defs
-from gt4py.eve.extended_typing import Never, Optional, ParamSpec, TypeAlias, TypeVar
+from gt4py.eve.extended_typing import Any, Never, Optional, ParamSpec, TypeAlias, TypeVar
 from gt4py.next import common
 from gt4py.next.embedded import (
     common as embedded_common,
@@ -41,18 +42,31 @@ except ImportError:
     cp: Optional[ModuleType] = None  # type:ignore[no-redef]
 
 try:
+    import jax
     from jax import numpy as jnp
 except ImportError:
+    jax: Optional[ModuleType] = None  # type:ignore[no-redef]
     jnp: Optional[ModuleType] = None  # type:ignore[no-redef]
 
 
 def _get_nd_array_class(*fields: common.Field | core_defs.Scalar) -> type[NdArrayField]:
-    for f in fields:
-        if isinstance(f, NdArrayField):
-            return f.__class__
+    return _find_nd_array_class(tuple(map(type, fields)))
+
+
+@functools.cache
+def _find_nd_array_class(types: tuple[type, ...]) -> type[NdArrayField]:
+    # the result only depends on the argument types, which repeat for every call of a builtin
+    for t in types:
+        if issubclass(t, NdArrayField):
+            return t
     raise AssertionError("No 'NdArrayField' found in the arguments.")
 
 
+def _asarray_if_needed(xp: ModuleType, value: Any) -> core_defs.NDArrayObject:
+    """Convert `value` to an array of the `xp` namespace, unless it is one already."""
+    return value if isinstance(value, xp.ndarray) else xp.asarray(value)
+
+
 def _make_builtin(
     builtin_name: str, array_builtin_name: str, reverse: bool = False
 ) -> Callable[..., NdArrayField]:
@@ -61,24 +75,25 @@ def _make_builtin(
         xp = cls_.array_ns
         op = getattr(xp, array_builtin_name)
 
-        domain_intersection = embedded_common.domain_intersection(
-            *[f.domain for f in fields if isinstance(f, common.Field)]
+        # classify the arguments only once, `None` marks scalars
+        domains = [f.domain if isinstance(f, common.Field) else None for f in fields]
+        field_domains = [d for d in domains if d is not None]
+        # fast path: fields on the same domain are neither broadcasted nor sliced
+        same_domain = all(d == field_domains[0] for d in field_domains[1:])
+        domain_intersection = (
+            field_domains[0] if same_domain else embedded_common.domain_intersection(*field_domains)
         )
 
         transformed: list[core_defs.NDArrayObject | core_defs.Scalar] = []
-        for f in fields:
-            if isinstance(f, common.Field):
-                if f.domain == domain_intersection:
-                    transformed.append(xp.asarray(f.ndarray))
-                else:
-                    f_broadcasted = _broadcast(f, domain_intersection.dims)
-                    f_slices = _get_slices_from_domain_slice(
-                        f_broadcasted.domain, domain_intersection
-                    )
-                    transformed.append(xp.asarray(f_broadcasted.ndarray[f_slices]))
-            else:
+        for f, f_domain in zip(fields, domains):
+            if f_domain is None:
                 assert core_defs.is_scalar_type(f)
                 transformed.append(f)
+            elif same_domain or f_domain == domain_intersection:
+                transformed.append(_asarray_if_needed(xp, f.ndarray))  # type: ignore[union-attr] # `f` is a field
+            else:
+                f_index = _broadcast_and_slice_index(f_domain, domain_intersection)
+                transformed.append(_asarray_if_needed(xp, f.ndarray[f_index]))  # type: ignore[union-attr] # `f` is a field
         if reverse:
             transformed.reverse()
         new_data = op(*transformed)
@@ -88,12 +103,19 @@ def _make_builtin(
     return _builtin_op
 
 
+# logical builtins are only dispatched for `bool` fields, but are built once instead of on every call
+_logical_and = _make_builtin("logical_and", "logical_and")
+_logical_or = _make_builtin("logical_or", "logical_or")
+_logical_xor = _make_builtin("logical_xor", "logical_xor")
+_invert = _make_builtin("invert", "invert")
+
+
 _Value: TypeAlias = common.Field | core_defs.ScalarT
 _P = ParamSpec("_P")
 _R = TypeVar("_R", _Value, tuple[_Value, ...])
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, eq=False)
 class NdArrayField(
     common.MutableField[common.DimsT, core_defs.ScalarT], common.FieldBuiltinFuncRegistry
 ):
@@ -115,11 +137,11 @@ class NdArrayField(
     def domain(self) -> common.Domain:
         return self._domain
 
-    @property
+    @functools.cached_property
     def shape(self) -> tuple[int, ...]:
         return self._ndarray.shape
 
-    @property
+    @functools.cached_property
     def __gt_origin__(self) -> tuple[int, ...]:
         assert common.Domain.is_finite(self._domain)
         return tuple(-r.start for r in self._domain.ranges)
@@ -141,11 +163,11 @@ class NdArrayField(
             )
         return self.ndarray.item()
 
-    @property
+    @functools.cached_property
     def codomain(self) -> type[core_defs.ScalarT]:
         return self.dtype.scalar_type
 
-    @property
+    @functools.cached_property
     def dtype(self) -> core_defs.DType[core_defs.ScalarT]:
         return core_defs.dtype(self._ndarray.dtype.type)
 
@@ -214,9 +236,12 @@ class NdArrayField(
             )
             assert isinstance(restricted_connectivity, common.ConnectivityField)
 
-            # then compute the index array
+            # then compute the index array, the shift (a full-size temporary) is skipped in the
+            # common case of a field starting at 0
             xp = self.array_ns
-            new_idx_array = xp.asarray(restricted_connectivity.ndarray) - current_range.start
+            new_idx_array = _asarray_if_needed(xp, restricted_connectivity.ndarray)
+            if current_range.start != 0:
+                new_idx_array = new_idx_array - current_range.start
             # finally, take the new array
             new_buffer = xp.take(self._ndarray, new_idx_array, axis=dim_idx)
 
@@ -226,8 +251,7 @@ class NdArrayField(
 
     def restrict(self, index: common.AnyIndexSpec) -> NdArrayField:
         new_domain, buffer_slice = self._slice(index)
-        new_buffer = self.ndarray[buffer_slice]
-        new_buffer = self.__class__.array_ns.asarray(new_buffer)
+        new_buffer = _asarray_if_needed(self.__class__.array_ns, self.ndarray[buffer_slice])
         return self.__class__.from_array(new_buffer, domain=new_domain)
 
     __getitem__ = restrict
@@ -277,6 +301,9 @@ class NdArrayField(
 
     __eq__ = _make_builtin("equal", "equal")  # type: ignore # mypy wants return `bool`
 
+    # `__eq__` is the element-wise builtin, therefore fields are hashed by identity
+    __hash__ = object.__hash__
+
     __gt__ = _make_builtin("greater", "greater")
 
     __ge__ = _make_builtin("greater_equal", "greater_equal")
@@ -287,28 +314,28 @@ class NdArrayField(
 
     def __and__(self, other: common.Field | core_defs.ScalarT) -> NdArrayField:
         if self.dtype == core_defs.BoolDType():
-            return _make_builtin("logical_and", "logical_and")(self, other)
+            return _logical_and(self, other)
         raise NotImplementedError("'__and__' not implemented for non-'bool' fields.")
 
     __rand__ = __and__
 
     def __or__(self, other: common.Field | core_defs.ScalarT) -> NdArrayField:
         if self.dtype == core_defs.BoolDType():
-            return _make_builtin("logical_or", "logical_or")(self, other)
+            return _logical_or(self, other)
         raise NotImplementedError("'__or__' not implemented for non-'bool' fields.")
 
     __ror__ = __or__
 
     def __xor__(self, other: common.Field | core_defs.ScalarT) -> NdArrayField:
         if self.dtype == core_defs.BoolDType():
-            return _make_builtin("logical_xor", "logical_xor")(self, other)
+            return _logical_xor(self, other)
         raise NotImplementedError("'__xor__' not implemented for non-'bool' fields.")
 
     __rxor__ = __xor__
 
     def __invert__(self) -> NdArrayField:
         if self.dtype == core_defs.BoolDType():
-            return _make_builtin("invert", "invert")(self)
+            return _invert(self)
         raise NotImplementedError("'__invert__' not implemented for non-'bool' fields.")
 
     def _slice(
@@ -327,7 +354,7 @@ class NdArrayField(
         return new_domain, slice_
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, eq=False)
 class NdArrayConnectivityField(  # type: ignore[misc] # for __ne__, __eq__
     common.ConnectivityField[common.DimsT, common.DimT],
     NdArrayField[common.DimsT, core_defs.IntegralScalar],
@@ -335,8 +362,12 @@ class NdArrayConnectivityField(  # type: ignore[misc] # for __ne__, __eq__
     _codomain: common.DimT
     _skip_value: Optional[core_defs.IntegralScalar]
 
+    __hash__ = object.__hash__  # `ConnectivityField` resets it by defining `__eq__`
+
     @functools.cached_property
     def _cache(self) -> dict:
+        # the cache lives and dies with the connectivity, whose buffer and domain are fixed,
+        # therefore neither needs to be part of the keys
         return {}
 
     @classmethod
@@ -396,7 +427,7 @@ class NdArrayConnectivityField(  # type: ignore[misc] # for __ne__, __eq__
     def inverse_image(
         self, image_range: common.UnitRange | common.NamedRange
     ) -> Sequence[common.NamedRange]:
-        cache_key = hash((id(self.ndarray), self.domain, image_range))
+        cache_key = ("inverse_image", image_range)
 
         if (new_dims := self._cache.get(cache_key, None)) is None:
             xp = self.array_ns
@@ -427,13 +458,13 @@ class NdArrayConnectivityField(  # type: ignore[misc] # for __ne__, __eq__
         return new_dims
 
     def restrict(self, index: common.AnyIndexSpec) -> NdArrayConnectivityField:
-        cache_key = (id(self.ndarray), self.domain, index)
+        cache_key = ("restrict", index)
 
         if (restricted_connectivity := self._cache.get(cache_key, None)) is None:
             cls = self.__class__
             xp = cls.array_ns
             new_domain, buffer_slice = self._slice(index)
-            new_buffer = xp.asarray(self.ndarray[buffer_slice])
+            new_buffer = _asarray_if_needed(xp, self.ndarray[buffer_slice])
             restricted_connectivity = cls(new_domain, new_buffer, self.codomain, self.skip_value)
             self._cache[cache_key] = restricted_connectivity
 
@@ -470,11 +501,26 @@ def _hypercube(
     """
     select_mask = (index_array >= image_range.start) & (index_array < image_range.stop)
 
-    nnz: tuple[core_defs.NDArrayObject, ...] = xp.nonzero(select_mask)
+    # flat (C-order) positions of the selected values: the per-dimension indices are recovered
+    # with integer arithmetic instead of materializing one index array per dimension
+    flat_nnz = xp.flatnonzero(select_mask)
+    if flat_nnz.size == 0:
+        return None
+
+    extrema: list[core_defs.NDArrayObject] = []
+    stride = select_mask.size
+    for dim_size in select_mask.shape:
+        stride //= dim_size
+        if not extrema:
+            # the first and last selected positions lie in the extreme rows of the first dimension
+            extrema.extend((flat_nnz[0] // stride, flat_nnz[-1] // stride))
+        else:
+            dim_nnz_indices = (flat_nnz // stride) % dim_size
+            extrema.extend((xp.min(dim_nnz_indices), xp.max(dim_nnz_indices)))
+    # transfer all bounds to the host at once, instead of synchronizing once per bound
+    bounds = xp.stack(extrema).tolist()
+    slices = [slice(start, stop + 1) for start, stop in zip(bounds[::2], bounds[1::2])]
 
-    slices = tuple(
-        slice(xp.min(dim_nnz_indices), xp.max(dim_nnz_indices) + 1) for dim_nnz_indices in nnz
-    )
     hcube = select_mask[tuple(slices)]
     if skip_value is not None:
         ignore_mask = index_array == skip_value
@@ -521,22 +567,27 @@ NdArrayField.register_builtin_func(
 NdArrayField.register_builtin_func(fbuiltins.where, _make_builtin("where", "where"))
 
 
-def _compute_mask_ranges(mask: core_defs.NDArrayObject) -> list[tuple[bool, common.UnitRange]]:
+def _compute_mask_ranges(
+    mask: core_defs.NDArrayObject, xp: ModuleType
+) -> list[tuple[bool, common.UnitRange]]:
     """Take a 1-dimensional mask and return a sequence of mappings from boolean values to ranges."""
-    # TODO: does it make sense to upgrade this naive algorithm to numpy?
     assert mask.ndim == 1
-    cur = bool(mask[0].item())
-    ind = 0
-    res = []
-    for i in range(1, mask.shape[0]):
-        if (
-            mask_i := bool(mask[i].item())
-        ) != cur:  # `.item()` to extract the scalar from a 0-d array in case of e.g. cupy
-            res.append((cur, common.UnitRange(ind, i)))
-            cur = mask_i
-            ind = i
-    res.append((cur, common.UnitRange(ind, mask.shape[0])))
-    return res
+    if mask.shape[0] == 0:
+        return []
+    if mask.dtype != bool:
+        # non-boolean masks (e.g. from `concat_where`) are interpreted by their truth value
+        mask = mask.astype(bool)
+    # a new range starts wherever the mask value differs from its predecessor
+    starts = xp.flatnonzero(mask[1:] != mask[:-1]) + 1
+    # transfer the first mask value together with the range boundaries in a single host copy
+    first_value, *inner_bounds = xp.concatenate((mask[:1].astype(starts.dtype), starts)).tolist()
+    bounds = [0, *inner_bounds, mask.shape[0]]
+    # consecutive ranges alternate between `True` and `False`
+    values = itertools.cycle((bool(first_value), not first_value))
+    return [
+        (value, common.UnitRange(start, stop))
+        for value, start, stop in zip(values, bounds[:-1], bounds[1:])
+    ]
 
 
 def _trim_empty_domains(
@@ -544,26 +595,12 @@ def _trim_empty_domains(
 ) -> list[tuple[bool, common.Domain]]:
     """Remove empty domains from beginning and end of the list."""
     lst = list(lst)
-    if not lst:
-        return lst
-    if lst[0][1].is_empty():
-        return _trim_empty_domains(lst[1:])
-    if lst[-1][1].is_empty():
-        return _trim_empty_domains(lst[:-1])
-    return lst
-
-
-def _to_field(
-    value: common.Field | core_defs.Scalar, nd_array_field_type: type[NdArrayField]
-) -> common.Field:
-    # TODO(havogt): this function is only to workaround broadcasting of scalars, once we have a ConstantField, we can broadcast to that directly
-    return (
-        value
-        if isinstance(value, common.Field)
-        else nd_array_field_type.from_array(
-            nd_array_field_type.array_ns.asarray(value), domain=common.Domain()
-        )
-    )
+    start, stop = 0, len(lst)
+    while start < stop and lst[start][1].is_empty():
+        start += 1
+    while stop > start and lst[stop - 1][1].is_empty():
+        stop -= 1
+    return lst[start:stop]
 
 
 def _intersect_fields(
@@ -571,23 +608,35 @@ def _intersect_fields(
     ignore_dims: Optional[common.Dimension | tuple[common.Dimension, ...]] = None,
 ) -> tuple[common.Field, ...]:
     # TODO(havogt): this function could be moved to common, but then requires a broadcast implementation for all field implementations;
-    # currently blocked, because requiring the `_to_field` function, see comment there.
+    # currently blocked, because scalars are broadcasted as 0-d arrays of the `NdArrayField` namespace.
     nd_array_class = _get_nd_array_class(*fields)
-    promoted_dims = common.promote_dims(
-        *(f.domain.dims for f in fields if isinstance(f, common.Field))
-    )
-    broadcasted_fields = [_broadcast(_to_field(f, nd_array_class), promoted_dims) for f in fields]
+    xp = nd_array_class.array_ns
+    buffers: list[core_defs.NDArrayObject] = []
+    domains: list[common.Domain] = []
+    for f in fields:
+        if isinstance(f, common.Field):
+            buffers.append(f.ndarray)
+            domains.append(f.domain)
+        else:
+            # TODO(havogt): once we have a ConstantField, we can broadcast to that directly
+            buffers.append(xp.asarray(f))
+            domains.append(common.Domain())
+    promoted_dims = tuple(common.promote_dims(*(d.dims for d in domains)))
 
+    # only the domains are broadcasted before the intersection, each buffer is then broadcasted
+    # and sliced with a single indexing operation
     intersected_domains = embedded_common.restrict_to_intersection(
-        *[f.domain for f in broadcasted_fields], ignore_dims=ignore_dims
+        *[_broadcast_domain(d, promoted_dims)[1] for d in domains], ignore_dims=ignore_dims
     )
 
     return tuple(
         nd_array_class.from_array(
-            f.ndarray[_get_slices_from_domain_slice(f.domain, intersected_domain)],
+            buffer[_broadcast_and_slice_index(domain, intersected_domain)],
             domain=intersected_domain,
         )
-        for f, intersected_domain in zip(broadcasted_fields, intersected_domains, strict=True)
+        for buffer, domain, intersected_domain in zip(
+            buffers, domains, intersected_domains, strict=True
+        )
     )
 
 
@@ -617,13 +666,25 @@ def _concat(*fields: common.Field, dim: common.Dimension) -> common.Field:
     if new_domain is None:
         raise embedded_exceptions.NonContiguousDomain(f"Cannot concatenate fields along {dim}.")
     nd_array_class = _get_nd_array_class(*fields)
-    return nd_array_class.from_array(
-        nd_array_class.array_ns.concatenate(
-            [nd_array_class.array_ns.broadcast_to(f.ndarray, f.domain.shape) for f in fields],
-            axis=new_domain.dim_index(dim),
-        ),
-        domain=new_domain,
-    )
+    xp = nd_array_class.array_ns
+    axis = new_domain.dim_index(dim)
+    assert axis is not None
+
+    if xp is jnp:
+        # JAX arrays are immutable, they can not be filled in place
+        result = xp.concatenate(
+            [xp.broadcast_to(f.ndarray, f.domain.shape) for f in fields], axis=axis
+        )
+    else:
+        # copy the fields directly into the preallocated result, broadcasting on assignment
+        result = xp.empty(new_domain.shape, dtype=xp.result_type(*(f.ndarray for f in fields)))
+        start = 0
+        for f in fields:
+            stop = start + f.domain.shape[axis]
+            result[(slice(None),) * axis + (slice(start, stop),)] = f.ndarray
+            start = stop
+
+    return nd_array_class.from_array(result, domain=new_domain)
 
 
 def _concat_where(
@@ -640,10 +701,26 @@ def _concat_where(
     # intersect the field in dimensions orthogonal to the mask, then all slices in the mask field have same domain
     t_broadcasted, f_broadcasted = _intersect_fields(true_field, false_field, ignore_dims=mask_dim)
 
+    if t_broadcasted.domain == f_broadcasted.domain and mask_dim in t_broadcasted.domain.dims:
+        # fast path: if both fields are defined on the same domain, the result is a single `where`
+        # on the part of this domain covered by the mask, instead of slicing and concatenating
+        result_domain = embedded_common.domain_intersection(t_broadcasted.domain, mask_field.domain)
+        if not result_domain.is_empty():
+            field_index = _broadcast_and_slice_index(t_broadcasted.domain, result_domain)
+            mask_index = _broadcast_and_slice_index(mask_field.domain, result_domain)
+            return cls_.from_array(
+                xp.where(
+                    mask_field.ndarray[mask_index],
+                    t_broadcasted.ndarray[field_index],
+                    f_broadcasted.ndarray[field_index],
+                ),
+                domain=result_domain,
+            )
+
     # TODO(havogt): for clarity, most of it could be implemented on named_range in the masked dimension, but we currently lack the utils
     # compute the consecutive ranges (first relative, then domain) of true and false values
     mask_values_to_relative_range_mapping: Iterable[tuple[bool, common.UnitRange]] = (
-        _compute_mask_ranges(mask_field.ndarray)
+        _compute_mask_ranges(mask_field.ndarray, xp)
     )
     mask_values_to_domain_mapping: Iterable[tuple[bool, common.Domain]] = (
         (mask, _relative_ranges_to_domain((relative_range,), mask_field.domain))
@@ -687,6 +764,29 @@ def _concat_where(
 NdArrayField.register_builtin_func(experimental.concat_where, _concat_where)  # type: ignore[has-type]
 
 
+def _masked_reduction(
+    xp: ModuleType,
+    reduction: Callable[..., core_defs.NDArrayObject],
+    mask: core_defs.NDArrayObject,
+    array: core_defs.NDArrayObject,
+    initial: core_defs.Scalar,
+    axis: int,
+) -> core_defs.NDArrayObject:
+    return reduction(xp.where(mask, array, initial), axis=axis)
+
+
+# array namespace specific variants of `_masked_reduction`, e.g. compiled ones
+_masked_reduction_implementations: dict[ModuleType, Callable[..., core_defs.NDArrayObject]] = {}
+
+
+@functools.lru_cache(maxsize=128)
+def _reduction_plan(
+    dims: tuple[common.Dimension, ...], axis: common.Dimension, origin_axis: common.Dimension
+) -> tuple[int, tuple[slice | None, ...]]:
+    """Return the position of `axis` in `dims` and the index broadcasting the neighbor table."""
+    return dims.index(axis), tuple(slice(None) if d in (axis, origin_axis) else None for d in dims)
+
+
 def _make_reduction(
     builtin_name: str, array_builtin_name: str, initial_value_op: Callable
 ) -> Callable[..., NdArrayField[common.DimsT, core_defs.ScalarT]]:
@@ -703,28 +803,47 @@ def _make_reduction(
             raise NotImplementedError(
                 "Reducing a field with more than one local dimension is not supported."
             )
-        reduce_dim_index = field.domain.dims.index(axis)
         current_offset_provider = embedded_context.offset_provider.get(None)
         assert current_offset_provider is not None
         offset_definition = current_offset_provider[
             axis.value
         ]  # assumes offset and local dimension have same name
         assert isinstance(offset_definition, itir_embedded.NeighborTableOffsetProvider)
-        new_domain = common.Domain(*[nr for nr in field.domain if nr.dim != axis])
-
-        broadcast_slice = tuple(
-            slice(None) if d in [axis, offset_definition.origin_axis] else xp.newaxis
-            for d in field.domain.dims
-        )
-        masked_array = xp.where(
-            xp.asarray(offset_definition.table[broadcast_slice]) != common._DEFAULT_SKIP_VALUE,
-            field.ndarray,
-            initial_value_op(field),
+        new_domain = field.domain.pop(axis)
+        reduce_dim_index, broadcast_slice = _reduction_plan(
+            field.domain.dims, axis, offset_definition.origin_axis
         )
+        reduction = getattr(xp, array_builtin_name)
+
+        table = offset_definition.table[broadcast_slice]
+        array = field.ndarray
+        if array.shape != (shape := xp.broadcast_shapes(array.shape, table.shape)):
+            # buffers with size 1 along a dimension hold the same value for all its indices,
+            # they are broadcasted (as a view) to the full shape before reducing
+            array = xp.broadcast_to(array, shape)
+
+        if not offset_definition.has_skip_values:
+            # all neighbors exist, no masking needed
+            return field.__class__.from_array(
+                reduction(array, axis=reduce_dim_index), domain=new_domain
+            )
 
-        return field.__class__.from_array(
-            getattr(xp, array_builtin_name)(masked_array, axis=reduce_dim_index), domain=new_domain
-        )
+        mask = _asarray_if_needed(xp, table) != common._DEFAULT_SKIP_VALUE
+        if xp is np:
+            # NumPy reductions support masking natively, which avoids materializing the masked array
+            result = reduction(
+                array,
+                axis=reduce_dim_index,
+                where=mask,
+                initial=initial_value_op(field),
+            )
+        else:
+            masked_reduction = _masked_reduction_implementations.get(xp, _masked_reduction)
+            result = masked_reduction(
+                xp, reduction, mask, array, initial_value_op(field), reduce_dim_index
+            )
+
+        return field.__class__.from_array(result, domain=new_domain)
 
     _builtin_op.__name__ = builtin_name
     return _builtin_op
@@ -795,20 +914,52 @@ if jnp:
 
     common._field.register(jnp.ndarray, JaxArrayField.from_array)
 
+    # fuses the masking and the reduction into a single XLA computation
+    _masked_reduction_implementations[jnp] = jax.jit(
+        _masked_reduction, static_argnames=("xp", "reduction", "axis")
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _broadcast_domain(
+    domain: common.Domain, new_dimensions: tuple[common.Dimension, ...]
+) -> tuple[tuple[slice | None, ...], common.Domain]:
+    """Return the buffer index inserting the new dimensions and the broadcasted domain."""
+    positions = tuple(domain.dim_index(dim) for dim in new_dimensions)
+    domain_slice = tuple(
+        slice(None) if pos is not None else None  # np.newaxis
+        for pos in positions
+    )
+    new_ranges = tuple(
+        domain.ranges[pos] if pos is not None else common.UnitRange.infinite() for pos in positions
+    )
+    return domain_slice, common.Domain(dims=new_dimensions, ranges=new_ranges)
+
 
 def _broadcast(field: common.Field, new_dimensions: Sequence[common.Dimension]) -> common.Field:
+    # `Domain.dims` is a tuple, a list of the same dimensions would never compare equal
+    new_dimensions = tuple(new_dimensions)
     if field.domain.dims == new_dimensions:
         return field
-    domain_slice: list[slice | None] = []
-    named_ranges = []
-    for dim in new_dimensions:
-        if (pos := embedded_common._find_index_of_dim(dim, field.domain)) is not None:
-            domain_slice.append(slice(None))
-            named_ranges.append(common.NamedRange(dim, field.domain[pos].unit_range))
-        else:
-            domain_slice.append(None)  # np.newaxis
-            named_ranges.append(common.NamedRange(dim, common.UnitRange.infinite()))
-    return common._field(field.ndarray[tuple(domain_slice)], domain=common.Domain(*named_ranges))
+    domain_slice, new_domain = _broadcast_domain(field.domain, new_dimensions)
+    # indexing is only needed to insert new dimensions
+    new_buffer = field.ndarray[domain_slice] if None in domain_slice else field.ndarray
+    return common._field(new_buffer, domain=new_domain)
+
+
+@functools.lru_cache(maxsize=1024)
+def _broadcast_and_slice_index(
+    domain: common.Domain, target_domain: common.Domain
+) -> tuple[common.RelativeIndexElement | None, ...]:
+    """Return the buffer index which broadcasts and slices a field on `domain` to `target_domain`.
+
+    The index only depends on the domains, so it is cached for the repeated combinations of
+    domains which occur in field arithmetic.
+    """
+    domain_slice, broadcasted_domain = _broadcast_domain(domain, target_domain.dims)
+    slices = _get_slices_from_domain_slice(broadcasted_domain, target_domain)
+    # slicing a new (length 1) dimension is a no-op, it only needs to be inserted
+    return tuple(s if ds is not None else None for ds, s in zip(domain_slice, slices, strict=True))
 
 
 def _builtins_broadcast(
@@ -824,6 +975,9 @@ NdArrayField.register_builtin_func(fbuiltins.broadcast, _builtins_broadcast)
 
 def _astype(field: common.Field | core_defs.ScalarT | tuple, type_: type) -> NdArrayField:
     if isinstance(field, NdArrayField):
+        if field.ndarray.dtype == type_:
+            # fields are immutable inside of field operators, the copy can be skipped
+            return field
         return field.__class__.from_array(field.ndarray.astype(type_), domain=field.domain)
     raise AssertionError("This is the NdArrayField implementation of 'fbuiltins.astype'.")
 
@@ -850,10 +1004,10 @@ def _get_slices_from_domain_slice(
                                        or ranges, a None is used to indicate expansion along that axis.
     """
     slice_indices: list[slice | common.IntIndex] = []
+    indices_or_ranges = dict(domain_slice)
 
-    for pos_old, (dim, _) in enumerate(domain):
-        if (pos := embedded_common._find_index_of_dim(dim, domain_slice)) is not None:
-            _, index_or_range = domain_slice[pos]
+    for pos_old, dim in enumerate(domain.dims):
+        if (index_or_range := indices_or_ranges.get(dim, None)) is not None:
             slice_indices.append(_compute_slice(index_or_range, domain, pos_old))
         else:
             slice_indices.append(slice(None))
@@ -876,20 +1030,21 @@ def _compute_slice(
     Raises:
         ValueError: If `new_rng` is not an integer or a UnitRange.
     """
+    domain_range = domain.ranges[pos]
     if isinstance(rng, common.UnitRange):
         start = (
-            rng.start - domain.ranges[pos].start
-            if common.UnitRange.is_left_finite(domain.ranges[pos])
+            rng.start - domain_range.start
+            if common.UnitRange.is_left_finite(domain_range)
             else None
         )
         stop = (
-            rng.stop - domain.ranges[pos].start
-            if common.UnitRange.is_right_finite(domain.ranges[pos])
+            rng.stop - domain_range.start
+            if common.UnitRange.is_right_finite(domain_range)
             else None
         )
         return slice(start, stop)
     elif common.is_int_index(rng):
         assert common.Domain.is_finite(domain)
-        return rng - domain.ranges[pos].start
+        return rng - domain_range.start
     else:
         raise ValueError(f"Can only use integer or UnitRange ranges, provided type: '{type(rng)}'.")
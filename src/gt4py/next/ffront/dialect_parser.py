@@ -16,7 +16,7 @@ import ast
 import textwrap
 import typing
 from dataclasses import dataclass
-from typing import Callable
+from typing import Callable, ClassVar
 
 from gt4py.eve.concepts import SourceLocation
 from gt4py.eve.extended_typing import Any, Generic, TypeVar
@@ -59,6 +59,18 @@ class DialectParser(ast.NodeVisitor, Generic[DialectRootT]):
     closure_vars: dict[str, Any]
     annotations: dict[str, Any]
 
+    #: ``visit_*`` methods by the AST node type they visit, collected once per parser class
+    _visitors: ClassVar[dict[type[ast.AST], Callable[..., Any]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._visitors = {
+            node_type: getattr(cls, name)
+            for name in dir(cls)
+            if name.startswith("visit_")
+            and isinstance(node_type := getattr(ast, name[len("visit_") :], None), type)
+        }
+
     @classmethod
     def apply(
         cls,
@@ -100,6 +112,12 @@ class DialectParser(ast.NodeVisitor, Generic[DialectRootT]):
     ) -> DialectRootT:
         return output_ast
 
+    def visit(self, node: ast.AST, **kwargs: Any) -> Any:
+        # dispatch on the node type, instead of looking up the method name for every node
+        if (visitor := self._visitors.get(type(node), None)) is None:
+            return self.generic_visit(node)
+        return visitor(self, node, **kwargs)
+
     def generic_visit(self, node: ast.AST) -> None:
         loc = self.get_location(node)
         feature = f"{type(node).__module__}.{type(node).__qualname__}"
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import ast
 import dataclasses
+import functools
 import typing
 from typing import Any, cast
 
@@ -30,7 +31,6 @@ from gt4py.next.ffront import (
     type_specifications as ts_ffront,
 )
 from gt4py.next.ffront.dialect_parser import DialectParser
-from gt4py.next.ffront.past_passes.closure_var_type_deduction import ClosureVarTypeDeduction
 from gt4py.next.ffront.past_passes.type_deduction import ProgramTypeDeduction
 from gt4py.next.otf import workflow
 from gt4py.next.type_system import type_specifications as ts, type_translation
@@ -72,13 +72,34 @@ class OptionalFuncToPastFactory(factory.Factory):
         workflow = func_to_past
         cached = factory.Trait(
             step=factory.LazyAttribute(
-                lambda o: workflow.CachedStep(
-                    step=o.workflow, hash_function=ffront_stages.fingerprint_stage
-                )
+                # the parsed program also depends on the closure variables, which are not part of
+                # the source fingerprint, therefore the definition itself is used as cache key
+                lambda o: workflow.CachedStep(step=o.workflow, hash_function=lambda inp: inp)
             )
         )
 
-        step = factory.LazyAttribute(lambda o: o.workflow)
+    step = factory.LazyAttribute(lambda o: o.workflow)
+
+
+_AST_BINARY_OPERATORS: dict[type[ast.operator], dialect_ast_enums.BinaryOperator] = {
+    ast.Add: dialect_ast_enums.BinaryOperator.ADD,
+    ast.Sub: dialect_ast_enums.BinaryOperator.SUB,
+    ast.Mult: dialect_ast_enums.BinaryOperator.MULT,
+    ast.Div: dialect_ast_enums.BinaryOperator.DIV,
+    ast.FloorDiv: dialect_ast_enums.BinaryOperator.FLOOR_DIV,
+    ast.Pow: dialect_ast_enums.BinaryOperator.POW,
+    ast.Mod: dialect_ast_enums.BinaryOperator.MOD,
+    ast.BitAnd: dialect_ast_enums.BinaryOperator.BIT_AND,
+    ast.BitOr: dialect_ast_enums.BinaryOperator.BIT_OR,
+    ast.BitXor: dialect_ast_enums.BinaryOperator.BIT_XOR,
+}
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _constant_type(value: Any) -> ts.TypeSpec:
+    # `ast.Constant` values are always hashable and `typed=True` keeps e.g. `1`, `1.0`
+    # and `True` apart, so the cache key is effectively `(type(value), value)`
+    return type_translation.from_value(value)
 
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
@@ -89,16 +110,18 @@ class ProgramParser(DialectParser[past.Program]):
     def _postprocess_dialect_ast(
         cls, output_node: past.Program, closure_vars: dict[str, Any], annotations: dict[str, Any]
     ) -> past.Program:
-        output_node = ClosureVarTypeDeduction.apply(output_node, closure_vars)
+        # the closure variable symbols are already typed from their values in
+        # `visit_FunctionDef`, a separate `ClosureVarTypeDeduction` pass is not needed
         return ProgramTypeDeduction.apply(output_node)
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> past.Program:
+        loc = self.get_location(node)
         closure_symbols: list[past.Symbol] = [
             past.Symbol(
                 id=name,
                 type=type_translation.from_value(val),
                 namespace=dialect_ast_enums.Namespace.CLOSURE,
-                location=self.get_location(node),
+                location=loc,
             )
             for name, val in self.closure_vars.items()
         ]
@@ -109,7 +132,7 @@ class ProgramParser(DialectParser[past.Program]):
             params=self.visit(node.args),
             body=[self.visit(node) for node in node.body],
             closure_vars=closure_symbols,
-            location=self.get_location(node),
+            location=loc,
         )
 
     def visit_arguments(self, node: ast.arguments) -> list[past.DataSymbol]:
@@ -127,39 +150,11 @@ class ProgramParser(DialectParser[past.Program]):
     def visit_Expr(self, node: ast.Expr) -> past.LocatedNode:
         return self.visit(node.value)
 
-    def visit_Add(self, node: ast.Add, **kwargs: Any) -> dialect_ast_enums.BinaryOperator:
-        return dialect_ast_enums.BinaryOperator.ADD
-
-    def visit_Sub(self, node: ast.Sub, **kwargs: Any) -> dialect_ast_enums.BinaryOperator:
-        return dialect_ast_enums.BinaryOperator.SUB
-
-    def visit_Mult(self, node: ast.Mult, **kwargs: Any) -> dialect_ast_enums.BinaryOperator:
-        return dialect_ast_enums.BinaryOperator.MULT
-
-    def visit_Div(self, node: ast.Div, **kwargs: Any) -> dialect_ast_enums.BinaryOperator:
-        return dialect_ast_enums.BinaryOperator.DIV
-
-    def visit_FloorDiv(self, node: ast.FloorDiv, **kwargs: Any) -> dialect_ast_enums.BinaryOperator:
-        return dialect_ast_enums.BinaryOperator.FLOOR_DIV
-
-    def visit_Pow(self, node: ast.Pow, **kwargs: Any) -> dialect_ast_enums.BinaryOperator:
-        return dialect_ast_enums.BinaryOperator.POW
-
-    def visit_Mod(self, node: ast.Mod, **kwargs: Any) -> dialect_ast_enums.BinaryOperator:
-        return dialect_ast_enums.BinaryOperator.MOD
-
-    def visit_BitAnd(self, node: ast.BitAnd, **kwargs: Any) -> dialect_ast_enums.BinaryOperator:
-        return dialect_ast_enums.BinaryOperator.BIT_AND
-
-    def visit_BitOr(self, node: ast.BitOr, **kwargs: Any) -> dialect_ast_enums.BinaryOperator:
-        return dialect_ast_enums.BinaryOperator.BIT_OR
-
-    def visit_BitXor(self, node: ast.BitXor, **kwargs: Any) -> dialect_ast_enums.BinaryOperator:
-        return dialect_ast_enums.BinaryOperator.BIT_XOR
-
     def visit_BinOp(self, node: ast.BinOp, **kwargs: Any) -> past.BinOp:
+        if (op := _AST_BINARY_OPERATORS.get(type(node.op), None)) is None:
+            self.generic_visit(node.op)  # raises for unsupported operators
         return past.BinOp(
-            op=self.visit(node.op),
+            op=op,
             left=self.visit(node.left),
             right=self.visit(node.right),
             location=self.get_location(node),
@@ -215,10 +210,10 @@ class ProgramParser(DialectParser[past.Program]):
     def visit_UnaryOp(self, node: ast.UnaryOp) -> past.Constant:
         loc = self.get_location(node)
         if isinstance(node.op, ast.USub) and isinstance(node.operand, ast.Constant):
-            symbol_type = type_translation.from_value(node.operand.value)
+            symbol_type = _constant_type(node.operand.value)
             return past.Constant(value=-node.operand.value, type=symbol_type, location=loc)
         raise errors.DSLError(loc, "Unary operators are only applicable to literals.")
 
     def visit_Constant(self, node: ast.Constant) -> past.Constant:
-        symbol_type = type_translation.from_value(node.value)
+        symbol_type = _constant_type(node.value)
         return past.Constant(value=node.value, type=symbol_type, location=self.get_location(node))
@@ -22,7 +22,7 @@ from typing import Any, ForwardRef, Optional
 import numpy as np
 import numpy.typing as npt
 
-from gt4py.eve import extended_typing as xtyping
+from gt4py.eve import extended_typing as xtyping, utils as eve_utils
 from gt4py.next import common
 from gt4py.next.type_system import type_info, type_specifications as ts
 
@@ -60,6 +60,7 @@ def get_scalar_kind(dtype: npt.DTypeLike) -> ts.ScalarKind:
         raise ValueError(f"Non-trivial dtypes like '{dtype}' are not yet supported.")
 
 
+@eve_utils.optional_lru_cache(maxsize=None, typed=True)
 def from_type_hint(
     type_hint: Any,
     *,
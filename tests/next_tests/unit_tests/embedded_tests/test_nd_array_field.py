@@ -22,9 +22,14 @@ import pytest
 from gt4py._core import definitions as core_defs
 from gt4py.next import common
 from gt4py.next.common import Dimension, Domain, UnitRange, NamedRange, NamedIndex
-from gt4py.next.embedded import exceptions as embedded_exceptions, nd_array_field
+from gt4py.next.embedded import (
+    context as embedded_context,
+    exceptions as embedded_exceptions,
+    nd_array_field,
+)
 from gt4py.next.embedded.nd_array_field import _get_slices_from_domain_slice
 from gt4py.next.ffront import fbuiltins
+from gt4py.next.iterator import embedded as itir_embedded
 
 from next_tests.integration_tests.feature_tests.math_builtin_test_data import math_builtin_test_data
 
@@ -301,6 +306,14 @@ def test_mixed_fields(product_nd_array_implementation):
     assert np.allclose(result.ndarray, expected)
 
 
+def test_field_hash_is_identity(nd_array_implementation):
+    field = _make_field_or_scalar([1.0, 2.0], nd_array_implementation)
+    same_data = _make_field_or_scalar([1.0, 2.0], nd_array_implementation)
+
+    assert hash(field) == hash(field)
+    assert len({field, field, same_data}) == 2
+
+
 def test_non_dispatched_function():
     @fbuiltins.BuiltInFunction
     def fma(a: common.Field, b: common.Field, c: common.Field, /) -> common.Field:
@@ -320,6 +333,36 @@ def test_non_dispatched_function():
     assert np.allclose(result.ndarray, expected)
 
 
+@pytest.mark.parametrize(
+    "buffer, has_skip_values, expected",
+    [
+        ([[1.0, 2.0, 3.0]], True, [3.0, 6.0]),  # size 1 along the origin dimension
+        ([[1.0], [2.0]], True, [2.0, 6.0]),  # size 1 along the reduced dimension
+        ([[1.0, 2.0, 3.0]], False, [6.0, 6.0]),
+        ([[1.0], [2.0]], False, [3.0, 6.0]),
+    ],
+)
+def test_neighbor_sum_broadcasted_buffer(buffer, has_skip_values, expected):
+    V = Dimension("V")
+    E = Dimension("E")
+    V2E = Dimension("V2E", common.DimensionKind.LOCAL)
+
+    field = common._field(np.asarray(buffer), domain=common.domain({V: 2, V2E: 3}))
+    table = (
+        [[0, 1, common._DEFAULT_SKIP_VALUE], [2, 3, 4]]
+        if has_skip_values
+        else [[0, 1, 2], [3, 4, 5]]
+    )
+    offset_provider = itir_embedded.NeighborTableOffsetProvider(
+        np.asarray(table), V, E, 3, has_skip_values=has_skip_values
+    )
+
+    with embedded_context.new_context(offset_provider={"V2E": offset_provider}) as ctx:
+        result = ctx.run(fbuiltins.neighbor_sum, field, axis=V2E)
+
+    assert np.array_equal(result.ndarray, expected)
+
+
 def test_remap_implementation():
     V = Dimension("V")
     E = Dimension("E")
@@ -417,6 +460,14 @@ def test_field_broadcast(new_dims, field, expected_domain):
     assert result.domain == expected_domain
 
 
+def test_field_broadcast_same_dims():
+    field = common._field(
+        np.arange(10), domain=common.Domain(dims=(D0,), ranges=(UnitRange(0, 10),))
+    )
+
+    assert nd_array_field._broadcast(field, [D0]) is field
+
+
 @pytest.mark.parametrize(
     "domain_slice",
     [(NamedRange(D0, UnitRange(0, 10)),), common.Domain(dims=(D0,), ranges=(UnitRange(0, 10),))],
@@ -865,6 +916,10 @@ def test_connectivity_field_inverse_image_2d_domain_skip_values():
         ([0, -1, 0], [(0, 3)]),
         ([[1, 1, 1], [1, 0, 0]], [(1, 2), (1, 3)]),
         ([[1, 0, -1], [1, 0, 0]], [(0, 2), (1, 3)]),
+        ([[[1, 1], [1, 0]], [[1, 1], [1, 0]]], [(0, 2), (1, 2), (1, 2)]),
+        ([[[1, 1], [1, 0]], [[1, 1], [0, 0]]], None),
+        ([[[1, 1], [1, 0]], [[1, 1], [1, 1]]], [(0, 1), (1, 2), (1, 2)]),
+        ([1, 2], None),
     ],
 )
 def test_hypercube(index_array, expected):
@@ -879,6 +934,46 @@ def test_hypercube(index_array, expected):
     assert result == expected
 
 
+@pytest.mark.parametrize(
+    "mask, expected",
+    [
+        ([], []),
+        ([True], [(True, (0, 1))]),
+        ([False, False], [(False, (0, 2))]),
+        ([True, True, False], [(True, (0, 2)), (False, (2, 3))]),
+        (
+            [False, True, False, False, True],
+            [(False, (0, 1)), (True, (1, 2)), (False, (2, 4)), (True, (4, 5))],
+        ),
+        ([0, 2, 1, 0], [(False, (0, 1)), (True, (1, 3)), (False, (3, 4))]),
+    ],
+)
+def test_compute_mask_ranges(nd_array_implementation, mask, expected):
+    xp = nd_array_implementation
+    expected = [(v, common.unit_range(r)) for v, r in expected]
+
+    result = nd_array_field._compute_mask_ranges(xp.asarray(mask), xp)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "ranges, expected",
+    [
+        ([], []),
+        ([(0, 0), (1, 1)], []),
+        ([(0, 0), (0, 2), (2, 2), (2, 3), (3, 3)], [(0, 2), (2, 2), (2, 3)]),
+    ],
+)
+def test_trim_empty_domains(ranges, expected):
+    lst = [(True, common.domain({D0: r})) for r in ranges]
+    expected = [(True, common.domain({D0: r})) for r in expected]
+
+    result = nd_array_field._trim_empty_domains(lst)
+
+    assert result == expected
+
+
 @pytest.mark.parametrize(
     "mask_data, true_data, false_data, expected",
     [
@@ -20,8 +20,8 @@ import gt4py.eve as eve
 import gt4py.next as gtx
 from gt4py.eve.pattern_matching import ObjectPattern as P
 from gt4py.next import errors, float64
-from gt4py.next.ffront import program_ast as past
-from gt4py.next.ffront.func_to_past import ProgramParser
+from gt4py.next.ffront import dialect_ast_enums, program_ast as past, stages as ffront_stages
+from gt4py.next.ffront.func_to_past import OptionalFuncToPastFactory, ProgramParser
 from gt4py.next.type_system import type_specifications as ts
 
 from next_tests.past_common_fixtures import (
@@ -71,6 +71,14 @@ def test_copy_parsing(copy_program_def):
     assert pattern_node.match(past_node, raise_exception=True)
 
 
+def test_closure_vars_typed(copy_program_def, identity_def):
+    past_node = ProgramParser.apply_to_function(copy_program_def)
+
+    (closure_var,) = (sym for sym in past_node.closure_vars if sym.id == "identity")
+    assert closure_var.type == gtx.field_operator(identity_def).__gt_type__()
+    assert closure_var.namespace == dialect_ast_enums.Namespace.CLOSURE
+
+
 def test_double_copy_parsing(double_copy_program_def):
     past_node = ProgramParser.apply_to_function(double_copy_program_def)
 
@@ -247,3 +255,25 @@ def test_domain_exception_6(identity_def):
     assert exc_info.match("Invalid call to 'domain_format_6'")
 
     assert re.search("Empty domain not allowed.", exc_info.value.__cause__.args[0]) is not None
+
+
+def test_cached_func_to_past(identity_def):
+    def make_program(fieldop):
+        def program(in_field: gtx.Field[[IDim], float64], out: gtx.Field[[IDim], float64]):
+            fieldop(in_field, out=out)
+
+        return program
+
+    first_op = gtx.field_operator(identity_def)
+    second_op = gtx.field_operator(identity_def)
+    first_definition = ffront_stages.ProgramDefinition(definition=make_program(first_op))
+    second_definition = ffront_stages.ProgramDefinition(definition=make_program(second_op))
+    cached_func_to_past = OptionalFuncToPastFactory(cached=True)
+
+    first_past = cached_func_to_past(first_definition)
+    second_past = cached_func_to_past(second_definition)
+
+    assert cached_func_to_past(first_definition) is first_past
+    # same source, but different closure variables
+    assert first_past.closure_vars["fieldop"] is first_op
+    assert second_past.closure_vars["fieldop"] is second_op